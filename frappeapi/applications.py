@@ -1,15 +1,84 @@
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Sequence, Type, Union
+from typing import Any, Callable, Dict, List, Optional, Protocol, Sequence, Type, Union
 
-from fastapi.datastructures import Default
+from fastapi.datastructures import Default, DefaultPlaceholder
 from fastapi.params import Depends
 from werkzeug.wrappers import Request as WerkzeugRequest, Response as WerkzeugResponse
 
 from frappeapi.responses import JSONResponse
 from frappeapi.routing import APIRouter
 
+_HTTP_METHODS = ("get", "post", "put", "delete", "patch", "options", "head")
+
+
+class _RouteDecorator(Protocol):
+	"""
+	Signature of `APIRouter.post`, `APIRouter.put`, ... as bound onto `FrappeAPI`.
+	"""
+
+	def __call__(
+		self,
+		*,
+		response_model: Any = ...,
+		status_code: Optional[int] = ...,
+		description: Optional[str] = ...,
+		tags: Optional[List[Union[str, Enum]]] = ...,
+		summary: Optional[str] = ...,
+		include_in_schema: bool = ...,
+		response_class: Union[Type[WerkzeugResponse], DefaultPlaceholder] = ...,
+		allow_guest: bool = ...,
+		xss_safe: bool = ...,
+	) -> Callable[[Callable], Callable]: ...
+
+
+class _GetRouteDecorator(Protocol):
+	"""
+	Signature of `APIRouter.get`, which also takes `cache_ttl`.
+	"""
+
+	def __call__(
+		self,
+		*,
+		response_model: Any = ...,
+		status_code: Optional[int] = ...,
+		description: Optional[str] = ...,
+		tags: Optional[List[Union[str, Enum]]] = ...,
+		summary: Optional[str] = ...,
+		include_in_schema: bool = ...,
+		response_class: Union[Type[WerkzeugResponse], DefaultPlaceholder] = ...,
+		allow_guest: bool = ...,
+		xss_safe: bool = ...,
+		cache_ttl: Optional[float] = ...,
+	) -> Callable[[Callable], Callable]: ...
+
 
 class FrappeAPI:
+	__slots__ = (
+		"title",
+		"summary",
+		"description",
+		"version",
+		"servers",
+		"openapi_version",
+		"openapi_tags",
+		"terms_of_service",
+		"contact",
+		"license_info",
+		"separate_input_output_schemas",
+		"exception_handlers",
+		"router",
+		*_HTTP_METHODS,
+	)
+
+	# Bound to the router's verb decorators in `__init__`, see `_HTTP_METHODS`.
+	get: _GetRouteDecorator
+	post: _RouteDecorator
+	put: _RouteDecorator
+	delete: _RouteDecorator
+	patch: _RouteDecorator
+	options: _RouteDecorator
+	head: _RouteDecorator
+
 	def __init__(
 		self,
 		title: Optional[str] = "Frappe API",
@@ -65,194 +134,16 @@ class FrappeAPI:
 			exception_handlers=self.exception_handlers,
 			default_response_class=default_response_class,
 		)
-		self.openapi_schema: Optional[Dict[str, Any]] = None
-
-	def openapi(self) -> Dict[str, Any]:
-		if self.openapi_schema is None:
-			self.openapi_schema = self.router.openapi()
-		return self.openapi_schema
-
-	def get(
-		self,
-		*,
-		response_model: Any = Default(None),
-		status_code: Optional[int] = None,
-		description: Optional[str] = None,
-		tags: Optional[List[Union[str, Enum]]] = None,
-		summary: Optional[str] = None,
-		include_in_schema: bool = True,
-		response_class: Type[WerkzeugResponse] = Default(JSONResponse),
-		# Frappe parameters
-		allow_guest: bool = False,
-		xss_safe: bool = False,
-	):
-		return self.router.get(
-			response_model=response_model,
-			status_code=status_code,
-			description=description,
-			tags=tags,
-			summary=summary,
-			include_in_schema=include_in_schema,
-			response_class=response_class,
-			allow_guest=allow_guest,
-			xss_safe=xss_safe,
-		)
-
-	def post(
-		self,
-		*,
-		response_model: Any = Default(None),
-		status_code: Optional[int] = None,
-		description: Optional[str] = None,
-		tags: Optional[List[Union[str, Enum]]] = None,
-		summary: Optional[str] = None,
-		include_in_schema: bool = True,
-		response_class: Type[WerkzeugResponse] = Default(JSONResponse),
-		# Frappe parameters
-		allow_guest: bool = False,
-		xss_safe: bool = False,
-	):
-		return self.router.post(
-			response_model=response_model,
-			status_code=status_code,
-			description=description,
-			tags=tags,
-			summary=summary,
-			include_in_schema=include_in_schema,
-			response_class=response_class,
-			allow_guest=allow_guest,
-			xss_safe=xss_safe,
-		)
-
-	def put(
-		self,
-		*,
-		response_model: Any = Default(None),
-		status_code: Optional[int] = None,
-		description: Optional[str] = None,
-		tags: Optional[List[Union[str, Enum]]] = None,
-		summary: Optional[str] = None,
-		include_in_schema: bool = True,
-		response_class: Type[WerkzeugResponse] = Default(JSONResponse),
-		# Frappe parameters
-		allow_guest: bool = False,
-		xss_safe: bool = False,
-	):
-		return self.router.put(
-			response_model=response_model,
-			status_code=status_code,
-			description=description,
-			tags=tags,
-			summary=summary,
-			include_in_schema=include_in_schema,
-			response_class=response_class,
-			allow_guest=allow_guest,
-			xss_safe=xss_safe,
-		)
 
-	def delete(
-		self,
-		*,
-		response_model: Any = Default(None),
-		status_code: Optional[int] = None,
-		description: Optional[str] = None,
-		tags: Optional[List[Union[str, Enum]]] = None,
-		summary: Optional[str] = None,
-		include_in_schema: bool = True,
-		response_class: Type[WerkzeugResponse] = Default(JSONResponse),
-		# Frappe parameters
-		allow_guest: bool = False,
-		xss_safe: bool = False,
-	):
-		return self.router.delete(
-			response_model=response_model,
-			status_code=status_code,
-			description=description,
-			tags=tags,
-			summary=summary,
-			include_in_schema=include_in_schema,
-			response_class=response_class,
-			allow_guest=allow_guest,
-			xss_safe=xss_safe,
-		)
+		# `app.get(...)` resolves straight to the router's decorator, no forwarding frame in between.
+		for method in _HTTP_METHODS:
+			setattr(self, method, getattr(self.router, method))
 
-	def patch(
-		self,
-		*,
-		response_model: Any = Default(None),
-		status_code: Optional[int] = None,
-		description: Optional[str] = None,
-		tags: Optional[List[Union[str, Enum]]] = None,
-		summary: Optional[str] = None,
-		include_in_schema: bool = True,
-		response_class: Type[WerkzeugResponse] = Default(JSONResponse),
-		# Frappe parameters
-		allow_guest: bool = False,
-		xss_safe: bool = False,
-	):
-		return self.router.patch(
-			response_model=response_model,
-			status_code=status_code,
-			description=description,
-			tags=tags,
-			summary=summary,
-			include_in_schema=include_in_schema,
-			response_class=response_class,
-			allow_guest=allow_guest,
-			xss_safe=xss_safe,
-		)
-
-	def options(
-		self,
-		*,
-		response_model: Any = None,
-		status_code: Optional[int] = None,
-		description: Optional[str] = None,
-		tags: Optional[List[Union[str, Enum]]] = None,
-		summary: Optional[str] = None,
-		include_in_schema: bool = True,
-		response_class: Type[WerkzeugResponse] = Default(JSONResponse),
-		# Frappe parameters
-		allow_guest: bool = False,
-		xss_safe: bool = False,
-	):
-		return self.router.options(
-			response_model=response_model,
-			status_code=status_code,
-			description=description,
-			tags=tags,
-			summary=summary,
-			include_in_schema=include_in_schema,
-			response_class=response_class,
-			allow_guest=allow_guest,
-			xss_safe=xss_safe,
-		)
+	def openapi(self) -> Dict[str, Any]:
+		return self.router.openapi()
 
-	def head(
-		self,
-		*,
-		response_model: Any = Default(None),
-		status_code: Optional[int] = None,
-		description: Optional[str] = None,
-		tags: Optional[List[Union[str, Enum]]] = None,
-		summary: Optional[str] = None,
-		include_in_schema: bool = True,
-		response_class: Type[WerkzeugResponse] = Default(JSONResponse),
-		# Frappe parameters
-		allow_guest: bool = False,
-		xss_safe: bool = False,
-	):
-		return self.router.head(
-			response_model=response_model,
-			status_code=status_code,
-			description=description,
-			tags=tags,
-			summary=summary,
-			include_in_schema=include_in_schema,
-			response_class=response_class,
-			allow_guest=allow_guest,
-			xss_safe=xss_safe,
-		)
+	def openapi_json(self, pretty: bool = False) -> bytes:
+		return self.router.openapi_json(pretty)
 
 	def exception_handler(self, exc_class: Type[Exception]) -> Callable:
 		"""
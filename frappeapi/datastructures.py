@@ -0,0 +1,20 @@
+from typing import Iterable, Tuple
+
+from starlette.datastructures import QueryParams as StarletteQueryParams
+
+
+class QueryParams(StarletteQueryParams):
+	"""
+	Starlette `QueryParams` that can be built straight from already-decoded `(str, str)` pairs,
+	like the ones Werkzeug's `request.args` holds.
+	"""
+
+	@classmethod
+	def from_pairs(cls, items: Iterable[Tuple[str, str]]) -> "QueryParams":
+		"""
+		Build query params in a single pass, skipping the parsing and `str` coercion done by `__init__`.
+		"""
+		query_params = cls.__new__(cls)
+		query_params._list = list(items)
+		query_params._dict = dict(query_params._list)
+		return query_params
@@ -1,8 +1,8 @@
-from fastapi.utils import is_body_allowed_for_status_code
 from werkzeug.wrappers import Request as WerkzeugRequest, Response as WerkzeugResponse
 
 from frappeapi.exceptions import HTTPException, RequestValidationError, ResponseValidationError
 from frappeapi.responses import JSONResponse
+from frappeapi.utils import is_body_allowed_for_status_code
 
 
 def request_validation_exception_handler(request: WerkzeugRequest, exc: RequestValidationError) -> WerkzeugResponse:
@@ -10,7 +10,7 @@ def request_validation_exception_handler(request: WerkzeugRequest, exc: RequestV
 
 
 def http_exception_handler(request: WerkzeugRequest, exc: HTTPException) -> WerkzeugResponse:
-	headers = getattr(exc, "headers", None)
+	headers = exc.headers
 	if not is_body_allowed_for_status_code(exc.status_code):
 		return JSONResponse(status_code=exc.status_code, headers=headers)
 
@@ -26,3 +26,10 @@ def response_validation_exception_handler(request: WerkzeugRequest, exc: Respons
 	> This way you and your clients can be certain that they will receive the data and the data shape expected.
 	"""
 	return JSONResponse(content={"detail": exc.errors()}, status_code=500)
+
+
+def unhandled_exception_handler(request: WerkzeugRequest, exc: Exception) -> WerkzeugResponse:
+	"""
+	Return a 500 response for exceptions that have no registered handler.
+	"""
+	return JSONResponse(content={"detail": repr(exc)}, status_code=500)
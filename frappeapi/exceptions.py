@@ -3,6 +3,8 @@ from typing import Any, Sequence
 
 from werkzeug.exceptions import HTTPException as WerkzeugHTTPException
 
+_HTTP_STATUS_PHRASES = {status.value: status.phrase for status in http.HTTPStatus}
+
 
 class FrappeAPIError(Exception):
 	pass
@@ -20,7 +22,7 @@ class HTTPException(WerkzeugHTTPException):
 		headers: dict[str, str] | None = None,
 	) -> None:
 		if detail is None:
-			detail = http.HTTPStatus(status_code).phrase
+			detail = _HTTP_STATUS_PHRASES.get(status_code) or http.HTTPStatus(status_code).phrase
 		super().__init__(description=detail, response=None)
 
 		self.status_code = status_code
@@ -2,9 +2,37 @@ import json
 from http import HTTPStatus
 from typing import Any, Optional
 
+from fastapi._compat import PYDANTIC_V2
 from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
 from werkzeug.wrappers import Response
 
+from frappeapi.utils import json_dumps
+
+try:
+	import orjson
+except ModuleNotFoundError:  # pragma: nocover
+	orjson = None  # type: ignore[assignment]
+
+
+def render_json(content: Any) -> bytes:
+	"""
+	Encode `content` to JSON bytes, the same as `json_dumps(jsonable_encoder(content))`.
+
+	With `orjson` the content is walked once, `jsonable_encoder` only runs on the objects
+	orjson cannot encode natively (Pydantic models, sets, `Decimal`, ...).
+	A Pydantic model passed as the whole content is serialized by pydantic-core directly.
+	Content orjson rejects (e.g. integers wider than 64 bits) takes the `jsonable_encoder` path.
+	"""
+	if PYDANTIC_V2 and isinstance(content, BaseModel):
+		return content.__pydantic_serializer__.to_json(content, by_alias=True)
+	if orjson is not None:
+		try:
+			return orjson.dumps(content, default=jsonable_encoder, option=orjson.OPT_NON_STR_KEYS)
+		except orjson.JSONEncodeError:
+			pass
+	return json_dumps(jsonable_encoder(content))
+
 
 class JSONResponse(Response):
 	"""
@@ -33,8 +61,7 @@ class JSONResponse(Response):
 			content_type: The content type to use. If provided, overrides media_type.
 		"""
 		if content is not None:
-			content = jsonable_encoder(content)
-			content = json.dumps(content)
+			content = render_json(content)
 
 		super().__init__(
 			response=content,
@@ -53,8 +80,7 @@ class JSONResponse(Response):
 	@json.setter
 	def json(self, value: Any) -> None:
 		"""Set new JSON data."""
-		encoded_value = jsonable_encoder(value)
-		self.set_data(json.dumps(encoded_value))
+		self.set_data(render_json(value))
 
 
 class PlainTextResponse(Response):
@@ -1,10 +1,15 @@
 import dataclasses
 import inspect
 import json
-from collections import defaultdict
+import sys
+import threading
+import time
+from collections import OrderedDict
 from contextlib import ExitStack
 from enum import Enum, IntEnum
-from typing import Any, Callable, Dict, List, Optional, Pattern, Sequence, Set, Tuple, Type, Union
+from functools import lru_cache
+from types import MappingProxyType, SimpleNamespace
+from typing import Any, Callable, Dict, Hashable, List, Mapping, Optional, Pattern, Sequence, Set, Tuple, Type, Union
 
 from typing_extensions import Literal
 
@@ -18,27 +23,20 @@ try:
 	import frappe
 	from frappe import whitelist
 except ImportError:
-	from functools import wraps
+	# A plain namespace, the attributes read by this module stay regular lookups.
+	frappe = SimpleNamespace(request=None, session=None, local=None)
 
-	class Frappe:
-		def __getattr__(self, item):
-			return
-
-	frappe = Frappe()
-
-	def whitelist(methods: Optional[List[str]] = None):
+	def whitelist(methods: Optional[List[str]] = None, allow_guest: bool = False, xss_safe: bool = False):
+		# Outside Frappe there is nothing to register, hand the function back as is.
 		def decorator(func):
-			@wraps(func)
-			def wrapper(*args, **kwargs):
-				return func(*args, **kwargs)
-
-			return wrapper
+			return func
 
 		return decorator
 
 
 from fastapi import params
 from fastapi._compat import (
+	PYDANTIC_V2,
 	BaseConfig,
 	ModelField,
 	Undefined,
@@ -54,7 +52,7 @@ from fastapi._compat import (
 	serialize_sequence_value,
 	value_is_sequence,
 )
-from fastapi.datastructures import Default, DefaultPlaceholder, FormData, Headers, QueryParams, UploadFile
+from fastapi.datastructures import Default, DefaultPlaceholder, FormData, Headers, UploadFile
 from fastapi.dependencies.models import Dependant
 from fastapi.dependencies.utils import (
 	SolvedDependency,
@@ -72,24 +70,32 @@ from fastapi.encoders import jsonable_encoder
 from fastapi.openapi.utils import get_openapi
 from fastapi.routing import APIRoute as FastAPIRoute, BaseRoute as FastAPIBaseRoute
 from fastapi.types import IncEx
-from fastapi.utils import generate_unique_id, get_value_or_default, is_body_allowed_for_status_code
+from fastapi.utils import generate_unique_id, get_value_or_default
 from pydantic import BaseModel, PydanticSchemaGenerationError
 from pydantic._internal._utils import lenient_issubclass
 from pydantic.fields import FieldInfo
 from starlette.datastructures import UploadFile as StarletteUploadFile
+from werkzeug.datastructures import FileStorage
 from werkzeug.wrappers import (
 	Request as WerkzeugRequest,
 	Response as WerkzeugResponse,
 )
 
+from frappeapi.datastructures import QueryParams
 from frappeapi.exception_handler import (
 	http_exception_handler,
 	request_validation_exception_handler,
 	response_validation_exception_handler,
+	unhandled_exception_handler,
 )
 from frappeapi.exceptions import FrappeAPIError, HTTPException, RequestValidationError, ResponseValidationError
 from frappeapi.responses import JSONResponse, PlainTextResponse
-from frappeapi.utils import extract_endpoint_relative_path
+from frappeapi.utils import extract_endpoint_relative_path, is_body_allowed_for_status_code, json_dumps
+
+# Shared by every route registered without exception handlers, it is only ever read.
+_EMPTY_EXCEPTION_HANDLERS: Mapping[Type[Exception], Callable[[WerkzeugRequest, Exception], WerkzeugResponse]] = (
+	MappingProxyType({})
+)
 
 
 def _prepare_response_content(
@@ -150,11 +156,16 @@ def serialize_response(
 	exclude_unset: bool = False,
 	exclude_defaults: bool = False,
 	exclude_none: bool = False,
+	as_json: bool = False,
 ) -> Any:
+	"""
+	Validate and serialize the endpoint's return value.
+
+	With `as_json` (Pydantic v2 and a response `field` only), pydantic-core writes the JSON bytes directly.
+	"""
 	if field:
 		errors = []
-		if not hasattr(field, "serialize"):
-			# pydantic v1
+		if not PYDANTIC_V2:
 			response_content = _prepare_response_content(
 				response_content,
 				exclude_unset=exclude_unset,
@@ -172,7 +183,23 @@ def serialize_response(
 		if errors:
 			raise ResponseValidationError(errors=errors, body=response_content)
 
-		if hasattr(field, "serialize"):
+		if PYDANTIC_V2:
+			if as_json:
+				if value is None:
+					# Same empty body `JSONResponse(None)` sends, rather than `null`.
+					return b""
+				if include is None and exclude is None and not (exclude_unset or exclude_defaults or exclude_none):
+					# The common case, no per-route options to forward.
+					return field._type_adapter.dump_json(value, by_alias=by_alias)
+				return field._type_adapter.dump_json(
+					value,
+					include=include,
+					exclude=exclude,
+					by_alias=by_alias,
+					exclude_unset=exclude_unset,
+					exclude_defaults=exclude_defaults,
+					exclude_none=exclude_none,
+				)
 			return field.serialize(
 				value,
 				include=include,
@@ -196,6 +223,46 @@ def serialize_response(
 		return jsonable_encoder(response_content)
 
 
+def _return_content(response_content: Any) -> Any:
+	return response_content
+
+
+def get_response_serializer(
+	*,
+	field: Optional[ModelField],
+	response_class: Type[WerkzeugResponse],
+	include: Optional[IncEx] = None,
+	exclude: Optional[IncEx] = None,
+	by_alias: bool = True,
+	exclude_unset: bool = False,
+	exclude_defaults: bool = False,
+	exclude_none: bool = False,
+	as_json: bool = False,
+) -> Callable[[Any], Any]:
+	"""
+	Pick, once per route, the callable turning an endpoint's return value into response content.
+	"""
+	if field is None:
+		# `JSONResponse` encodes any content itself in a single pass, other response classes get
+		# the JSON-compatible data `serialize_response` would have produced.
+		return _return_content if response_class is JSONResponse else jsonable_encoder
+
+	def serialize(response_content: Any) -> Any:
+		return serialize_response(
+			field=field,
+			response_content=response_content,
+			include=include,
+			exclude=exclude,
+			by_alias=by_alias,
+			exclude_unset=exclude_unset,
+			exclude_defaults=exclude_defaults,
+			exclude_none=exclude_none,
+			as_json=as_json,
+		)
+
+	return serialize
+
+
 def create_model_field(
 	name: str,
 	type_: Any,
@@ -225,29 +292,36 @@ def create_model_field(
 		) from None
 
 
+@lru_cache(maxsize=None)
+def create_response_model_field(model: Type[BaseModel]) -> ModelField:
+	"""
+	Create the serialization field for a Pydantic model response once, and share it between routes.
+
+	A model's response schema is a `$ref` to its definition, so the per-route field name never shows up.
+	"""
+	return create_model_field(name="Response_" + model.__name__, type_=model, mode="serialization")
+
+
 def _extract_form_body(
 	body_fields: List[ModelField],
 	received_body: FormData,
 ) -> Dict[str, Any]:
 	values = {}
-	first_field = body_fields[0]
-	first_field_info = first_field.field_info
-
 	for field in body_fields:
 		value = _get_multidict_value(field, received_body)
 
-		if isinstance(first_field_info, params.File) and is_bytes_field(field) and isinstance(value, UploadFile):
+		# Every upload arrives as an `UploadFile`, it is only read here, for the fields that want bytes.
+		if isinstance(value, UploadFile) and is_bytes_field(field):
 			# Synchronously read the file content using the underlying file object
 			value = value.file.read()
-		elif is_bytes_sequence_field(field) and isinstance(first_field_info, params.File) and value_is_sequence(value):
+		elif value_is_sequence(value) and is_bytes_sequence_field(field):
 			# For sequence types, read each file sequentially
 			assert isinstance(value, sequence_types)  # type: ignore[arg-type]
 			results: List[Union[bytes, str]] = []
 
 			for sub_value in value:
-				# Synchronously read each file and append the content
-				file_content = sub_value.file.read()
-				results.append(file_content)
+				# Synchronously read each file and append the content, plain form values are kept as sent
+				results.append(sub_value.file.read() if isinstance(sub_value, UploadFile) else sub_value)
 
 			value = serialize_sequence_value(field=field, value=results)
 		if value is not None:
@@ -273,10 +347,11 @@ def request_body_to_args(
 	single_not_embedded_field = len(body_fields) == 1 and not embed_body_fields
 	first_field = body_fields[0]
 	body_to_process = received_body
-	fields_to_extract: List[ModelField] = body_fields
-	if single_not_embedded_field and lenient_issubclass(first_field.type_, BaseModel):
-		fields_to_extract = get_cached_model_fields(first_field.type_)
 	if isinstance(received_body, FormData):
+		# Only form bodies are extracted field by field, JSON bodies skip the model field lookup.
+		fields_to_extract: List[ModelField] = body_fields
+		if single_not_embedded_field and lenient_issubclass(first_field.type_, BaseModel):
+			fields_to_extract = get_cached_model_fields(first_field.type_)
 		body_to_process = _extract_form_body(fields_to_extract, received_body)
 	if single_not_embedded_field:
 		loc: Tuple[str, ...] = ("body",)
@@ -284,11 +359,13 @@ def request_body_to_args(
 		return {first_field.name: v_}, errors_
 
 	for field in body_fields:
-		loc = ("body", field.alias)
+		# `alias` is a property on FastAPI's ModelField, read it once per field.
+		alias = field.alias
+		loc = ("body", alias)
 		value: Optional[Any] = None
 		if body_to_process is not None:
 			try:
-				value = body_to_process.get(field.alias)
+				value = body_to_process.get(alias)
 			# If the received body is a list, not a dict
 			except AttributeError:
 				errors.append(get_missing_field_error(loc))
@@ -301,6 +378,57 @@ def request_body_to_args(
 	return values, errors
 
 
+def is_json_content_type(content_type: str) -> bool:
+	"""
+	Whether a `Content-Type` header value is `application/json` or an `application/*+json` type.
+
+	Same result as `email.message.Message.get_content_maintype()`/`get_content_subtype()`
+	without building a message object for every request.
+	"""
+	media_type = content_type.partition(";")[0].strip().lower()
+	maintype, _, subtype = media_type.partition("/")
+	if maintype != "application" or "/" in subtype:
+		return False
+	return subtype == "json" or subtype.endswith("+json")
+
+
+def get_request_query_params(request: WerkzeugRequest) -> QueryParams:
+	"""
+	Return the request's query params as starlette `QueryParams`, built once per request.
+	"""
+	query_params = getattr(request, "_frappeapi_query_params", None)
+	if query_params is None:
+		# Reuse Werkzeug's parsed (and cached) `request.args` rather than parsing the raw query string again.
+		query_params = QueryParams.from_pairs(request.args.items(multi=True))
+		request._frappeapi_query_params = query_params  # type: ignore[attr-defined]
+
+	return query_params
+
+
+def get_request_headers(request: WerkzeugRequest) -> Headers:
+	"""
+	Return the request's headers as starlette `Headers`, built once per request.
+	"""
+	request_headers = getattr(request, "_frappeapi_headers", None)
+	if request_headers is None:
+		# Starlette Headers is an immutable, case-insensitive, and a multidict data structure
+		# it allows the same header key to have a multiple values (i.e comma-separated)
+		# But, Until now, Frappe or somthing in between
+		# choose a single Value (e.g., the last occurrence) to represent the header.
+		combined_headers: Dict[str, str] = {}
+		for key, value in request.headers.items():
+			# Repeated keys are rare, only those pay for a join.
+			if key in combined_headers:
+				combined_headers[key] = combined_headers[key] + ", " + value
+			else:
+				combined_headers[key] = value
+
+		request_headers = Headers(combined_headers)
+		request._frappeapi_headers = request_headers  # type: ignore[attr-defined]
+
+	return request_headers
+
+
 def parse_and_validate_request(
 	*,
 	request: WerkzeugRequest,
@@ -316,26 +444,8 @@ def parse_and_validate_request(
 ):
 	values: Dict[str, Any] = {}
 	errors: List[Any] = []
-	if response is None:
-		response = WerkzeugResponse()
-		if "content-length" in response.headers:
-			del response.headers["content-length"]
-
-		response.status = 200
-
-	# TODO: Request Query Params
-	request_query_params = QueryParams(request.query_string)
-	# TODO: Headers
-	# Starlette Headers is an immutable, case-insensitive, and a multidict data structure
-	# it allows the same header key to have a multiple values (i.e comma-separated)
-	# But, Until now, Frappe or somthing in between
-	# choose a single Value (e.g., the last occurrence) to represent the header.
-	headers_dict = defaultdict(list)
-	for key, value in request.headers.items():
-		headers_dict[key].append(value)
-
-	combined_headers = {key: ", ".join(values) for key, values in headers_dict.items()}
-	request_headers = Headers(combined_headers)
+	# No placeholder response is built when none is passed in: endpoints cannot receive it,
+	# so it would only ever carry Werkzeug's defaults.
 
 	# TODO: Cookies
 
@@ -352,17 +462,70 @@ def parse_and_validate_request(
 		values.update(body_values)
 		errors.extend(body_errors)
 
-	query_values, query_errors = request_params_to_args(dependant.query_params, request_query_params)
-	header_values, header_errors = request_params_to_args(dependant.header_params, request_headers)
+	# TODO: Request Query Params
+	# Query params and headers are only converted for routes that declare some.
+	if dependant.query_params:
+		query_values, query_errors = request_params_to_args(dependant.query_params, get_request_query_params(request))
+		values.update(query_values)
+		errors.extend(query_errors)
 
-	values.update(query_values)
-	values.update(header_values)
-	errors += query_errors + header_errors
+	# TODO: Headers
+	if dependant.header_params:
+		header_values, header_errors = request_params_to_args(dependant.header_params, get_request_headers(request))
+		values.update(header_values)
+		errors.extend(header_errors)
 
 	# TODO: response is expected to be a Starlette Response, but it is WerkzeugResponse
 	return SolvedDependency(values=values, errors=errors, background_tasks=None, response=response, dependency_cache={})
 
 
+class ResponseCache:
+	"""
+	An in-memory LRU cache of successful responses, each entry living for `ttl` seconds.
+
+	Entries are keyed by the site, the session user, the method and the raw query string, so it is
+	only safe for endpoints whose response depends on nothing else (no body, headers or side effects).
+	The serialized body is stored, and a fresh response object is built on every hit.
+	"""
+
+	def __init__(self, ttl: float, maxsize: int = 128):
+		self.ttl = ttl
+		self.maxsize = maxsize
+		self._entries: OrderedDict[Hashable, Tuple[float, bytes, int, List[Tuple[str, str]]]] = OrderedDict()
+		self._lock = threading.Lock()
+
+	def make_key(self, request: WerkzeugRequest) -> Hashable:
+		# A worker can serve several sites, the same user name on two sites must not share entries.
+		site = getattr(getattr(frappe, "local", None), "site", None)
+		session = getattr(frappe, "session", None)
+		return (site, getattr(session, "user", None), request.method, request.query_string)
+
+	def get(self, key: Hashable) -> Optional[WerkzeugResponse]:
+		with self._lock:
+			entry = self._entries.get(key)
+			if entry is None:
+				return None
+			expires_at, data, status_code, headers = entry
+			if expires_at <= time.monotonic():
+				del self._entries[key]
+				return None
+			self._entries.move_to_end(key)
+
+		return WerkzeugResponse(data, status=status_code, headers=headers)
+
+	def set(self, key: Hashable, response: WerkzeugResponse) -> None:
+		entry = (time.monotonic() + self.ttl, response.get_data(), response.status_code, list(response.headers.items()))
+		with self._lock:
+			self._entries[key] = entry
+			self._entries.move_to_end(key)
+			if len(self._entries) > self.maxsize:
+				self._entries.popitem(last=False)
+
+	def clear(self) -> None:
+		with self._lock:
+			self._entries.clear()
+
+
 class APIRoute(FastAPIRoute):
 	def __init__(
 		self,
@@ -397,10 +560,17 @@ class APIRoute(FastAPIRoute):
 		# Frappe parameters
 		exception_handlers: Dict[Type[Exception], Callable[[WerkzeugRequest, Exception], WerkzeugResponse]]
 		| None = None,
+		cache_ttl: Optional[float] = None,
 	):
 		self.prefix = "/api/method"
 		self.endpoint = endpoint
-		self.path = self.prefix + "/" + extract_endpoint_relative_path(self.endpoint) + "." + self.endpoint.__name__
+		module_path = extract_endpoint_relative_path(self.endpoint)
+		if module_path is None:
+			raise FrappeAPIError(
+				f"Cannot build a route for {self.endpoint.__qualname__}: its module is not inside a Frappe app."
+			)
+		# Interned, as it is the key routes are registered under.
+		self.path = sys.intern(f"{self.prefix}/{module_path}.{self.endpoint.__name__}")
 
 		if isinstance(response_model, DefaultPlaceholder):
 			return_annotation = get_typed_return_annotation(self.endpoint)
@@ -418,7 +588,10 @@ class APIRoute(FastAPIRoute):
 		self.response_model_exclude_defaults = response_model_exclude_defaults
 		self.response_model_exclude_none = response_model_exclude_none
 		self.include_in_schema = include_in_schema
-		self.response_class = response_class
+		# Resolve the `Default(...)` placeholder once here instead of on every request.
+		self.response_class: Type[WerkzeugResponse] = (
+			response_class.value if isinstance(response_class, DefaultPlaceholder) else response_class
+		)
 		self.dependency_overrides_provider = dependency_overrides_provider
 		self.callbacks = callbacks
 		self.openapi_extra = openapi_extra
@@ -432,7 +605,11 @@ class APIRoute(FastAPIRoute):
 
 		if methods is None:
 			methods = ["GET"]
-		self.methods: Set[str] = {method.upper() for method in methods}
+		# Fixed once the route is built.
+		self.methods: Set[str] = frozenset(method.upper() for method in methods)  # type: ignore[assignment]
+		self._repr = (
+			f"{self.__class__.__name__}(path={self.path!r}, name={self.name!r}, methods={sorted(self.methods)!r})"
+		)
 		if isinstance(generate_unique_id_function, DefaultPlaceholder):
 			current_generate_unique_id = generate_unique_id_function.value
 		else:
@@ -444,19 +621,25 @@ class APIRoute(FastAPIRoute):
 			status_code = int(status_code)
 
 		self.status_code = status_code
+		# If status_code was set, use it, otherwise use the default from the
+		# response class, in the case of redirect it's 307.
+		self._response_args: Dict[str, Any] = {"status_code": status_code} if status_code else {}
 
 		if self.response_model:
 			assert is_body_allowed_for_status_code(
 				status_code
 			), f"Status code {status_code} must not have a response body"
 
-			response_name = "Response_" + self.unique_id
+			if lenient_issubclass(self.response_model, BaseModel):
+				self.response_field = create_response_model_field(self.response_model)
+			else:
+				response_name = "Response_" + self.unique_id
 
-			self.response_field = create_model_field(
-				name=response_name,
-				type_=self.response_model,
-				mode="serialization",
-			)
+				self.response_field = create_model_field(
+					name=response_name,
+					type_=self.response_model,
+					mode="serialization",
+				)
 			self.secure_cloned_response_field = self.response_field
 		else:
 			self.response_field = None  # type: ignore
@@ -476,8 +659,11 @@ class APIRoute(FastAPIRoute):
 				assert is_body_allowed_for_status_code(
 					additional_status_code
 				), f"Status code {additional_status_code} must not have a response body"
-				response_name = f"Response_{additional_status_code}_{self.unique_id}"
-				response_field = create_model_field(name=response_name, type_=model, mode="serialization")
+				if lenient_issubclass(model, BaseModel):
+					response_field = create_response_model_field(model)
+				else:
+					response_name = f"Response_{additional_status_code}_{self.unique_id}"
+					response_field = create_model_field(name=response_name, type_=model, mode="serialization")
 				response_fields[additional_status_code] = response_field
 
 		if response_fields:
@@ -503,99 +689,103 @@ class APIRoute(FastAPIRoute):
 			name=self.unique_id,
 			embed_body_fields=self._embed_body_fields,
 		)
+		self._is_body_form = bool(self.body_field and isinstance(self.body_field.field_info, params.Form))
+		if self._is_body_form:
+			# Checked once here rather than on every request.
+			assert (
+				parse_options_header is not None
+			), "The `python-multipart` library must be installed to use form parsing."
+		# Plain JSON responses with a response model take their body straight from pydantic-core.
+		self._dump_response_json = bool(
+			PYDANTIC_V2 and self.secure_cloned_response_field and self.response_class is JSONResponse
+		)
+		self._serialize_response = get_response_serializer(
+			field=self.secure_cloned_response_field,
+			response_class=self.response_class,
+			include=self.response_model_include,
+			exclude=self.response_model_exclude,
+			by_alias=self.response_model_by_alias,
+			exclude_unset=self.response_model_exclude_unset,
+			exclude_defaults=self.response_model_exclude_defaults,
+			exclude_none=self.response_model_exclude_none,
+			as_json=self._dump_response_json,
+		)
 
-		self.exception_handlers = {} if exception_handlers is None else exception_handlers
+		self.exception_handlers = _EMPTY_EXCEPTION_HANDLERS if exception_handlers is None else exception_handlers
+		if cache_ttl and (
+			self.methods != {"GET"}
+			or self.dependant.header_params
+			or self.dependant.cookie_params
+			or self.body_field is not None
+		):
+			# Cached responses are keyed on the query string only, anything else would leak between callers.
+			raise FrappeAPIError(
+				f"Cannot cache {self.path}: `cache_ttl` is only supported on GET routes without header, "
+				"cookie or body parameters."
+			)
+		self.response_cache = ResponseCache(ttl=cache_ttl) if cache_ttl else None
 
 	def handle_request(self, *args, **kwargs) -> WerkzeugResponse:
-		MAX_IN_MEMORY_FILE_SIZE = 1 * 1024 * 1024  # 1MB
 		request = frappe.request
-		is_body_form = self.body_field and isinstance(self.body_field.field_info, params.Form)
+		if request is None:
+			raise FrappeAPIError(f"{self.path} was called outside of a Frappe request.")
+
+		cache_key: Optional[Hashable] = None
+		if self.response_cache is not None:
+			cache_key = self.response_cache.make_key(request)
+			cached_response = self.response_cache.get(cache_key)
+			if cached_response is not None:
+				return cached_response
 
+		# Closes the uploaded files (and anything else registered) once the request is handled.
 		with ExitStack() as file_stack:
 			try:
 				body: Any = None
 				if self.body_field:
-					if is_body_form:
-						# Ensure python-multipart is available
-						assert (
-							parse_options_header is not None
-						), "The `python-multipart` library must be installed to use form parsing."
-
+					if self._is_body_form:
 						# Convert werkzeug headers to starlette headers
-						headers_dict = defaultdict(list)
-						for key, value in request.headers.items():
-							headers_dict[key].append(value)
+						request_headers = get_request_headers(request)
 
-						combined_headers = {key: ", ".join(values) for key, values in headers_dict.items()}
-						request_headers = Headers(combined_headers)
-
-						# items of FormData
-						_items: list[tuple[str, str | StarletteUploadFile]] = []
-
-						# Add form fields
-						if request.form:
-							for key, value in request.form.items():
-								_items.append((key, value))
+						# items of FormData, every value of a repeated key is kept for `List[...]` fields
+						_items: list[tuple[str, str | bytes | StarletteUploadFile]] = list(
+							request.form.items(multi=True)
+						)
 
 						# Add and manage file fields
-						if request.files:
-							for field_name, fileobj in request.files.items():
-								if hasattr(fileobj, "read"):
-									content_length = getattr(fileobj, "content_length", None)
-									# Check if content_length is set and is greater than 0
-									# This is to avoid the case where content_length is not set
-									# and the file is being read into memory
-									if content_length is not None and content_length > 0:
-										if content_length <= MAX_IN_MEMORY_FILE_SIZE:
-											# Small file: Read content into memory
-											file_content = fileobj.read()
-											_items.append((field_name, file_content))
-											fileobj.close()  # Explicitly close the file
-										else:
-											# Large file: Wrap in UploadFile without reading
-											upload_file = UploadFile(
-												file=fileobj,
-												headers=request_headers,
-											)
-											_items.append((field_name, upload_file))
-											if hasattr(fileobj, "close"):
-												# Attach close callback to the file object
-												file_stack.callback(fileobj.close)
-									else:
-										# content_length is not set; treat as large file
-										upload_file = UploadFile(
-											file=fileobj,
-											filename=fileobj.filename,
-											headers=request_headers,
-										)
-										_items.append((field_name, upload_file))
-										if hasattr(fileobj, "close"):
-											file_stack.callback(fileobj.close)
-								else:
-									# Handle cases where 'read' is not available
-									raise HTTPException(
-										status_code=400,
-										detail=f"Cannot process the uploaded file for field '{field_name}'.",
-									)
+						for field_name, fileobj in request.files.items(multi=True):
+							if not isinstance(fileobj, FileStorage):
+								raise HTTPException(
+									status_code=400,
+									detail=f"Cannot process the uploaded file for field '{field_name}'.",
+								)
+
+							# Werkzeug already spools the part (in memory or on disk), wrap it as is. The bytes are
+							# only read in `_extract_form_body`, for the fields typed as `bytes`.
+							upload_file = UploadFile(
+								file=fileobj,
+								filename=fileobj.filename,
+								headers=request_headers,
+							)
+							_items.append((field_name, upload_file))
+							# Attach close callback to the file object
+							file_stack.callback(fileobj.close)
 						body = FormData(_items)
 					else:
 						# Handle JSON or other non-form bodies
 						body_bytes = request.get_data()
 						if body_bytes:
-							json_body: Any = Undefined
 							content_type_value = request.headers.get("content-type", "")
 							if not content_type_value:
-								json_body = request.get_json(silent=True)
+								# Same as Werkzeug's `get_json(silent=True)`, no JSON content type gives no body.
+								body = None
+							elif is_json_content_type(content_type_value):
+								# Parse the bytes read above, invalid JSON gives no body (as with `silent=True`).
+								try:
+									body = json.loads(body_bytes)
+								except ValueError:
+									body = None
 							else:
-								import email.message
-
-								message = email.message.Message()
-								message["content-type"] = content_type_value
-								if message.get_content_maintype() == "application":
-									subtype = message.get_content_subtype()
-									if subtype == "json" or subtype.endswith("+json"):
-										json_body = request.get_json(silent=True)
-							body = json_body if json_body != Undefined else body_bytes
+								body = body_bytes
 			except json.JSONDecodeError as e:
 				validation_error = RequestValidationError(
 					[
@@ -618,109 +808,80 @@ class APIRoute(FastAPIRoute):
 				raise http_error from e
 
 			errors: List[Any] = []
-			with ExitStack() as exit_stack:
-				try:
-					solved_result = parse_and_validate_request(
-						request=request,
-						dependant=self.dependant,
-						body=body,
-						exit_stack=exit_stack,
-						embed_body_fields=self._embed_body_fields,
-					)
-					errors = solved_result.errors
-					if not errors:
-						request_data = solved_result.values
-						raw_response = self.endpoint(**request_data)
-
-						if isinstance(raw_response, WerkzeugResponse):
-							# if raw_response.background is None:
-							# 	raw_response.background = solved_result.background_tasks
-							response = raw_response
-						else:
-							# response_args: Dict[str, Any] = {"background": solved_result.background_tasks}
-							response_args: Dict[str, Any] = {}
-							# If status_code was set, use it, otherwise use the default from the
-							# # response class, in the case of redirect it's 307
-							current_status_code = (
-								self.status_code if self.status_code else solved_result.response.status_code
-							)
-							if current_status_code is not None:
-								response_args["status_code"] = current_status_code
-							if solved_result.response.status_code:
-								response_args["status_code"] = solved_result.response.status_code
-
-							content = serialize_response(
-								field=self.secure_cloned_response_field,
-								response_content=raw_response,
-								include=self.response_model_include,
-								exclude=self.response_model_exclude,
-								by_alias=self.response_model_by_alias,
-								exclude_unset=self.response_model_exclude_unset,
-								exclude_defaults=self.response_model_exclude_defaults,
-								exclude_none=self.response_model_exclude_none,
-							)
-
-							if isinstance(self.response_class, DefaultPlaceholder):
-								actual_response_class = self.response_class.value
-							else:
-								actual_response_class = self.response_class
-
-							response = actual_response_class(content, **response_args)
-							if not is_body_allowed_for_status_code(response.status_code):
-								response.data = b""
-
-							for key, value in solved_result.response.headers.items():
-								if key not in response.headers:
-									response.headers.add(key, value)
-					if errors:
-						validation_error = RequestValidationError(errors, body=body)
-						raise validation_error
-				except RequestValidationError as exc:
-					if self.exception_handlers.get(RequestValidationError):
-						response = self.exception_handlers[RequestValidationError](request, exc)
+			try:
+				solved_result = parse_and_validate_request(
+					request=request,
+					dependant=self.dependant,
+					body=body,
+					exit_stack=file_stack,
+					embed_body_fields=self._embed_body_fields,
+				)
+				errors = solved_result.errors
+				if not errors:
+					request_data = solved_result.values
+					raw_response = self.endpoint(**request_data)
+
+					if isinstance(raw_response, WerkzeugResponse):
+						# if raw_response.background is None:
+						# 	raw_response.background = solved_result.background_tasks
+						response = raw_response
 					else:
-						response = request_validation_exception_handler(request, exc)
+						content = self._serialize_response(raw_response)
 
-				except ResponseValidationError as exc:
-					if self.exception_handlers.get(ResponseValidationError):
-						response = self.exception_handlers[ResponseValidationError](request, exc)
-					else:
-						response = response_validation_exception_handler(request, exc)
-				except HTTPException as exc:
-					if self.exception_handlers.get(HTTPException):
-						response = self.exception_handlers[HTTPException](request, exc)
-					else:
-						response = http_exception_handler(request, exc)
-				except Exception as exc:
-					# If any other exception is raised, return a 500 response.
-					# First check if there is a custom exception handler for this exception.
-					# If not, return a 500 response with the exception details.
-					# Subress the exception details to avoid exposing sensitive information.
-					if self.exception_handlers.get(type(exc)):
-						response = self.exception_handlers[type(exc)](request, exc)
-					else:
-						response = JSONResponse(content={"detail": repr(exc)}, status_code=500)
-				else:
-					# The else block will run only if no exception is raised in the try block
-					# So no need to handle anything here. Let Frappe handle DB sync.
-					pass
-				finally:
-					# https://docs.python.org/3/tutorial/errors.html#defining-clean-up-actions
-
-					# > - If an exception occurs during execution of the try clause,
-					# the exception may be handled by an except clause.
-					# > - If the exception is not handled by an except clause,
-					# the exception is re-raised after the finally clause has been executed.
-					# > - An exception could occur during execution of an except or else clause.
-					# Again, the exception is re-raised after the finally clause has been executed.
-					# > If the finally clause executes a break, continue or return statement,
-					# exceptions are not re-raised.
-					# > If the try statement reaches a break, continue or return statement,
-					# the finally clause will execute just prior to the break, continue or return statement’s execution.
-					# > If a finally clause includes a return statement,
-					# the returned value will be the one from the finally clause’s return statement,
-					# not the value from the try clause’s return statement.
-					pass
+						if self._dump_response_json:
+							# Already encoded, don't let JSONResponse encode it a second time.
+							response = self.response_class(**self._response_args)
+							response.set_data(content)
+						else:
+							response = self.response_class(content, **self._response_args)
+						if not is_body_allowed_for_status_code(response.status_code):
+							response.data = b""
+				if errors:
+					validation_error = RequestValidationError(errors, body=body)
+					raise validation_error
+			# Handlers are looked up on each exception rather than resolved in `__init__`: the mapping is
+			# shared with the app, and `@app.exception_handler` may register one after the route exists.
+			except RequestValidationError as exc:
+				handler = (
+					self.exception_handlers.get(RequestValidationError) or request_validation_exception_handler
+				)
+				response = handler(request, exc)
+			except ResponseValidationError as exc:
+				handler = (
+					self.exception_handlers.get(ResponseValidationError) or response_validation_exception_handler
+				)
+				response = handler(request, exc)
+			except HTTPException as exc:
+				handler = self.exception_handlers.get(HTTPException) or http_exception_handler
+				response = handler(request, exc)
+			except Exception as exc:
+				# If any other exception is raised, return a 500 response.
+				# First check if there is a custom exception handler for this exception.
+				# If not, return a 500 response with the exception details.
+				# Subress the exception details to avoid exposing sensitive information.
+				handler = self.exception_handlers.get(type(exc)) or unhandled_exception_handler
+				response = handler(request, exc)
+			else:
+				# The else block will run only if no exception is raised in the try block
+				# So no need to handle anything here. Let Frappe handle DB sync.
+				pass
+			finally:
+				# https://docs.python.org/3/tutorial/errors.html#defining-clean-up-actions
+
+				# > - If an exception occurs during execution of the try clause,
+				# the exception may be handled by an except clause.
+				# > - If the exception is not handled by an except clause,
+				# the exception is re-raised after the finally clause has been executed.
+				# > - An exception could occur during execution of an except or else clause.
+				# Again, the exception is re-raised after the finally clause has been executed.
+				# > If the finally clause executes a break, continue or return statement,
+				# exceptions are not re-raised.
+				# > If the try statement reaches a break, continue or return statement,
+				# the finally clause will execute just prior to the break, continue or return statement’s execution.
+				# > If a finally clause includes a return statement,
+				# the returned value will be the one from the finally clause’s return statement,
+				# not the value from the try clause’s return statement.
+				pass
 
 		# TODO:
 		# Avoid the error from bubbling up to the user.
@@ -737,13 +898,19 @@ class APIRoute(FastAPIRoute):
 
 			return PlainTextResponse(content="Internal server error", status_code=500)
 
+		# Passthrough (e.g. `send_file`) and streamed bodies can't be read back without consuming them.
+		if (
+			cache_key is not None
+			and 200 <= response.status_code < 300
+			and not response.direct_passthrough
+			and not response.is_streamed
+		):
+			self.response_cache.set(cache_key, response)
+
 		return response
 
 	def __repr__(self) -> str:
-		class_name = self.__class__.__name__
-		methods = sorted(self.methods or [])
-		path, name = self.path, self.name
-		return f"{class_name}(path={path!r}, name={name!r}, methods={methods!r})"
+		return self._repr
 
 
 class APIRouter:
@@ -767,7 +934,8 @@ class APIRouter:
 		| None = None,
 	):
 		self.default_response_class = default_response_class
-		self.routes: List[APIRoute] = []
+		# Keyed by path, a Frappe method path maps to exactly one endpoint.
+		self.routes: Dict[str, APIRoute] = {}
 		self.exception_handlers = exception_handlers
 		self.title = title
 		self.version = version
@@ -782,16 +950,28 @@ class APIRouter:
 		self.webhooks = webhooks
 		self.servers = servers
 		self.openapi_schema: Optional[Dict[str, Any]] = None
+		self._openapi_json: Dict[bool, bytes] = {}
+		# The routes `openapi_schema` was built from, `self.routes` is public and may be edited directly.
+		self._openapi_routes: Tuple[APIRoute, ...] = ()
 
 	def openapi(self) -> Dict[str, Any]:
-		if self.openapi_schema is None:
+		# This serves the docs, not API requests, so an O(n) snapshot of the routes is affordable. Routes
+		# are compared by identity, Starlette's `Route.__eq__` ignores everything but path, endpoint and methods.
+		routes = tuple(self.routes.values())
+		if (
+			self.openapi_schema is None
+			or len(routes) != len(self._openapi_routes)
+			or any(route is not cached for route, cached in zip(routes, self._openapi_routes))
+		):
+			self._openapi_json = {}
+			self._openapi_routes = routes
 			self.openapi_schema = get_openapi(
 				title=self.title,
 				version=self.version,
 				openapi_version=self.openapi_version,
 				summary=self.summary,
 				description=self.description,
-				routes=self.routes,
+				routes=list(routes),
 				webhooks=self.webhooks,
 				tags=self.openapi_tags,
 				servers=self.servers,
@@ -803,10 +983,23 @@ class APIRouter:
 
 		return self.openapi_schema
 
+	def openapi_json(self, pretty: bool = False) -> bytes:
+		"""
+		Return the OpenAPI schema serialized to JSON, computed once and reused until the routes change.
+
+		The output is compact, pass `pretty=True` for an indented copy (cached separately).
+		"""
+		openapi_schema = self.openapi()  # Also drops the serialized copies when the routes changed.
+		openapi_json = self._openapi_json.get(pretty)
+		if openapi_json is None:
+			openapi_json = self._openapi_json[pretty] = json_dumps(openapi_schema, indent=pretty)
+
+		return openapi_json
+
 	def api_route(
 		self,
 		*,
-		response_model: Any = None,
+		response_model: Any = Default(None),
 		status_code: Optional[int] = None,
 		description: Optional[str] = None,
 		tags: Optional[List[Union[str, Enum]]] = None,
@@ -817,6 +1010,7 @@ class APIRouter:
 		# Frappe parameters
 		allow_guest: bool = False,
 		xss_safe: bool = False,
+		cache_ttl: Optional[float] = None,
 	):
 		def decorator(func: Callable):
 			# Register the route
@@ -833,8 +1027,13 @@ class APIRouter:
 				summary=summary,
 				include_in_schema=include_in_schema,
 				response_class=current_response_class,
+				cache_ttl=cache_ttl,
 			)
-			self.routes.append(route)
+			# Re-registering a path (e.g. on module reload) replaces the previous route.
+			self.routes[route.path] = route
+			# A new route changes the schema, drop the cached copies.
+			self.openapi_schema = None
+			self._openapi_json = {}
 
 			# When the route is called, it will be handled by the route's handle_request method
 			@whitelist(methods=methods, allow_guest=allow_guest, xss_safe=xss_safe)
@@ -848,16 +1047,17 @@ class APIRouter:
 	def get(
 		self,
 		*,
-		response_model: Any = None,
+		response_model: Any = Default(None),
 		status_code: Optional[int] = None,
 		description: Optional[str] = None,
 		tags: Optional[List[Union[str, Enum]]] = None,
 		summary: Optional[str] = None,
 		include_in_schema: bool = True,
-		response_class: Type[WerkzeugResponse] = Default(JSONResponse),
+		response_class: Union[Type[WerkzeugResponse], DefaultPlaceholder] = Default(JSONResponse),
 		# Frappe parameters
 		allow_guest: bool = False,
 		xss_safe: bool = False,
+		cache_ttl: Optional[float] = None,
 	):
 		return self.api_route(
 			methods=["GET"],
@@ -870,12 +1070,13 @@ class APIRouter:
 			response_class=response_class,
 			allow_guest=allow_guest,
 			xss_safe=xss_safe,
+			cache_ttl=cache_ttl,
 		)
 
 	def post(
 		self,
 		*,
-		response_model: Any = None,
+		response_model: Any = Default(None),
 		status_code: Optional[int] = None,
 		description: Optional[str] = None,
 		tags: Optional[List[Union[str, Enum]]] = None,
@@ -902,7 +1103,7 @@ class APIRouter:
 	def put(
 		self,
 		*,
-		response_model: Any = None,
+		response_model: Any = Default(None),
 		status_code: Optional[int] = None,
 		description: Optional[str] = None,
 		tags: Optional[List[Union[str, Enum]]] = None,
@@ -929,7 +1130,7 @@ class APIRouter:
 	def delete(
 		self,
 		*,
-		response_model: Any = None,
+		response_model: Any = Default(None),
 		status_code: Optional[int] = None,
 		description: Optional[str] = None,
 		tags: Optional[List[Union[str, Enum]]] = None,
@@ -956,7 +1157,7 @@ class APIRouter:
 	def patch(
 		self,
 		*,
-		response_model: Any = None,
+		response_model: Any = Default(None),
 		status_code: Optional[int] = None,
 		description: Optional[str] = None,
 		tags: Optional[List[Union[str, Enum]]] = None,
@@ -1010,7 +1211,7 @@ class APIRouter:
 	def head(
 		self,
 		*,
-		response_model: Any = None,
+		response_model: Any = Default(None),
 		status_code: Optional[int] = None,
 		description: Optional[str] = None,
 		tags: Optional[List[Union[str, Enum]]] = None,
@@ -1,12 +1,41 @@
 import inspect
+import json
 import os
+from functools import lru_cache
+from typing import Any, Optional, Union
+
+try:
+	import orjson
+except ModuleNotFoundError:  # pragma: nocover
+	orjson = None  # type: ignore[assignment]
+
+# Stdlib fallback for `json_dumps`, built once and matching orjson's compact UTF-8 output.
+_COMPACT_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+# Ref: https://github.com/OAI/OpenAPI-Specification/blob/main/versions/3.1.0.md#patterned-fields-1
+_STATUS_CODE_PATTERNS = frozenset({"default", "1XX", "2XX", "3XX", "4XX", "5XX"})
+_BODY_DISALLOWED_STATUS_CODES = frozenset({204, 205, 304})
+
+
+def is_body_allowed_for_status_code(status_code: Union[int, str, None]) -> bool:
+	if status_code is None or status_code in _STATUS_CODE_PATTERNS:
+		return True
+	current_status_code = status_code if type(status_code) is int else int(status_code)
+	return current_status_code >= 200 and current_status_code not in _BODY_DISALLOWED_STATUS_CODES
 
 
 def extract_endpoint_relative_path(func):
 	"""
 	Extract the relative path of the endpoint from the function for the API docs.
 	"""
-	full_path = inspect.getfile(func)
+	return _module_relative_path(inspect.getfile(func))
+
+
+@lru_cache(maxsize=None)
+def _module_relative_path(full_path: str) -> Optional[str]:
+	"""
+	Convert a module file path into its dotted path relative to the Frappe app, once per module.
+	"""
 	path_parts = full_path.split(os.sep)
 	try:
 		apps_index = path_parts.index("apps") + 2
@@ -16,3 +45,21 @@ def extract_endpoint_relative_path(func):
 		return ".".join(sub_path_parts)
 	except ValueError:
 		return None
+
+
+def json_dumps(content: Any, *, indent: bool = False) -> bytes:
+	"""
+	Serialize JSON-compatible content to bytes, using `orjson` when it is installed.
+
+	Output is compact unless `indent` is set, in which case it is indented by two spaces.
+	Content orjson rejects (e.g. integers wider than 64 bits) is encoded by the standard library.
+	"""
+	if orjson is not None:
+		option = orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2 if indent else orjson.OPT_NON_STR_KEYS
+		try:
+			return orjson.dumps(content, option=option)
+		except orjson.JSONEncodeError:
+			pass
+	if indent:
+		return json.dumps(content, ensure_ascii=False, indent=2).encode("utf-8")
+	return _COMPACT_JSON_ENCODER.encode(content).encode("utf-8")
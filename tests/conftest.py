@@ -0,0 +1,41 @@
+from types import SimpleNamespace
+
+import pytest
+from werkzeug.test import EnvironBuilder
+from werkzeug.wrappers import Request
+
+from frappeapi import FrappeAPI, routing
+
+
+@pytest.fixture
+def frappe(monkeypatch):
+	"""
+	The `frappe` module as seen by `frappeapi.routing`, with the request, session user and site tests can set.
+	"""
+	stand_in = SimpleNamespace(
+		request=None,
+		session=SimpleNamespace(user="Administrator"),
+		local=SimpleNamespace(site="site1.localhost"),
+	)
+	monkeypatch.setattr(routing, "frappe", stand_in)
+	return stand_in
+
+
+@pytest.fixture
+def app(monkeypatch):
+	# Test endpoints are not inside a Frappe app, route them under their module name instead.
+	monkeypatch.setattr(routing, "extract_endpoint_relative_path", lambda func: func.__module__)
+	return FrappeAPI()
+
+
+@pytest.fixture
+def call(frappe):
+	"""
+	Call a decorated endpoint the way Frappe does, with `frappe.request` set from Werkzeug's test builder.
+	"""
+
+	def call(endpoint, method="GET", **kwargs):
+		frappe.request = Request(EnvironBuilder(method=method, **kwargs).get_environ())
+		return endpoint()
+
+	return call
@@ -0,0 +1,72 @@
+import io
+import json
+from typing import List
+
+from fastapi import File, Form, UploadFile
+
+
+def test_upload_file(app, call):
+	@app.post()
+	def upload(file: UploadFile = File()):
+		return {"filename": file.filename, "content": file.file.read().decode()}
+
+	response = call(upload, "POST", data={"file": (io.BytesIO(b"hello"), "a.txt")})
+
+	assert response.status_code == 200
+	assert json.loads(response.get_data()) == {"filename": "a.txt", "content": "hello"}
+
+
+def test_bytes_file(app, call):
+	@app.post()
+	def upload(file: bytes = File()):
+		return {"content": file.decode()}
+
+	response = call(upload, "POST", data={"file": (io.BytesIO(b"hello"), "a.txt")})
+
+	assert response.status_code == 200
+	assert json.loads(response.get_data()) == {"content": "hello"}
+
+
+def test_every_file_of_a_list_of_bytes(app, call):
+	@app.post()
+	def upload(files: List[bytes] = File()):
+		return {"contents": [file.decode() for file in files]}
+
+	response = call(
+		upload,
+		"POST",
+		data={"files": [(io.BytesIO(b"one"), "1.txt"), (io.BytesIO(b"two"), "2.txt")]},
+	)
+
+	assert response.status_code == 200
+	assert json.loads(response.get_data()) == {"contents": ["one", "two"]}
+
+
+def test_form_fields_before_file_fields(app, call):
+	@app.post()
+	def upload(note: str = Form(), file: bytes = File(), files: List[bytes] = File()):
+		return {"note": note, "file": file.decode(), "files": [f.decode() for f in files]}
+
+	response = call(
+		upload,
+		"POST",
+		data={
+			"note": "hi",
+			"file": (io.BytesIO(b"single"), "s.txt"),
+			"files": [(io.BytesIO(b"one"), "1.txt"), (io.BytesIO(b"two"), "2.txt")],
+		},
+	)
+
+	assert response.status_code == 200
+	assert json.loads(response.get_data()) == {"note": "hi", "file": "single", "files": ["one", "two"]}
+
+
+def test_repeated_form_key(app, call):
+	@app.post()
+	def tags(tags: List[str] = Form()):
+		return {"tags": tags}
+
+	response = call(tags, "POST", data={"tags": ["a", "b", "c"]})
+
+	assert response.status_code == 200
+	assert json.loads(response.get_data()) == {"tags": ["a", "b", "c"]}
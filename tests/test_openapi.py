@@ -0,0 +1,37 @@
+import json
+
+from frappeapi.routing import APIRoute
+
+
+def test_openapi_json_is_cached(app):
+	@app.get()
+	def items():
+		return []
+
+	assert app.openapi_json() is app.openapi_json()
+	assert json.loads(app.openapi_json()) == app.openapi()
+
+
+def test_schema_follows_direct_edits_of_routes(app):
+	def first():
+		return []
+
+	app.get(summary="A")(first)
+
+	@app.get(summary="B")
+	def second():
+		return []
+
+	router = app.router
+	path = next(iter(router.routes))
+	assert app.openapi()["paths"][path]["get"]["summary"] == "A"
+	app.openapi_json()
+
+	# Replacing a route in place keeps the size and order of `routes`.
+	router.routes[path] = APIRoute(first, summary="A2", exception_handlers=router.exception_handlers)
+	assert app.openapi()["paths"][path]["get"]["summary"] == "A2"
+	assert json.loads(app.openapi_json())["paths"][path]["get"]["summary"] == "A2"
+
+	del router.routes[path]
+	assert path not in app.openapi()["paths"]
+	assert path not in json.loads(app.openapi_json())["paths"]
@@ -0,0 +1,124 @@
+import io
+
+import pytest
+from fastapi import Body, Header
+from werkzeug.utils import send_file
+from werkzeug.wrappers import Response
+
+from frappeapi import routing
+from frappeapi.exceptions import FrappeAPIError
+from frappeapi.routing import ResponseCache
+
+
+@pytest.fixture
+def counted(app):
+	calls = []
+
+	@app.get(cache_ttl=60)
+	def items(q: str = ""):
+		calls.append(q)
+		return {"q": q, "call": len(calls)}
+
+	return items, calls
+
+
+def test_repeated_get_is_served_from_cache(counted, call):
+	items, calls = counted
+
+	first = call(items, query_string="q=a")
+	second = call(items, query_string="q=a")
+
+	assert second.status_code == 200
+	assert second.get_data() == first.get_data()
+	assert second.headers["Content-Type"] == "application/json"
+	assert calls == ["a"]
+
+
+def test_entries_are_isolated_by_query_user_and_site(counted, call, frappe):
+	items, calls = counted
+
+	call(items, query_string="q=a")
+	call(items, query_string="q=b")
+	frappe.session.user = "Guest"
+	call(items, query_string="q=a")
+	frappe.local.site = "site2.localhost"
+	call(items, query_string="q=a")
+	call(items, query_string="q=a")
+
+	assert calls == ["a", "b", "a", "a"]
+
+
+def test_failed_responses_are_not_cached(app, call):
+	calls = []
+
+	@app.get(cache_ttl=60)
+	def positive(n: int):
+		calls.append(n)
+		return n
+
+	assert call(positive, query_string="n=x").status_code == 422
+	assert call(positive, query_string="n=x").status_code == 422
+	assert calls == []
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+	now = [1000.0]
+	monkeypatch.setattr(routing.time, "monotonic", lambda: now[0])
+	cache = ResponseCache(ttl=10)
+	cache.set("key", Response(b"cached"))
+
+	now[0] += 9
+	assert cache.get("key").get_data() == b"cached"
+	now[0] += 1
+	assert cache.get("key") is None
+
+
+def test_least_recently_used_entry_is_evicted():
+	cache = ResponseCache(ttl=60, maxsize=2)
+	cache.set("a", Response(b"a"))
+	cache.set("b", Response(b"b"))
+	cache.get("a")
+	cache.set("c", Response(b"c"))
+
+	assert cache.get("b") is None
+	assert cache.get("a").get_data() == b"a"
+	assert cache.get("c").get_data() == b"c"
+
+
+def test_cache_ttl_requires_get_only(app):
+	with pytest.raises(FrappeAPIError):
+
+		@app.router.api_route(methods=["GET", "POST"], cache_ttl=60)
+		def items():
+			return []
+
+
+def test_cache_ttl_rejects_header_params(app):
+	with pytest.raises(FrappeAPIError):
+
+		@app.get(cache_ttl=60)
+		def items(x_token: str = Header()):
+			return []
+
+
+def test_cache_ttl_rejects_body_params(app):
+	with pytest.raises(FrappeAPIError):
+
+		@app.get(cache_ttl=60)
+		def items(payload: dict = Body()):
+			return []
+
+
+def test_passthrough_responses_are_not_cached(app, call):
+	calls = []
+
+	@app.get(cache_ttl=60)
+	def download():
+		calls.append(1)
+		return send_file(io.BytesIO(b"hello"), mimetype="text/plain", environ=routing.frappe.request.environ)
+
+	for _ in range(2):
+		response = call(download)
+		assert response.status_code == 200
+		assert b"".join(response.response) == b"hello"
+	assert calls == [1, 1]
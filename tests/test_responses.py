@@ -0,0 +1,33 @@
+import json
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class Item(BaseModel):
+	name: str
+
+
+def test_none_gives_an_empty_body_with_and_without_a_response_model(app, call):
+	@app.get()
+	def with_model() -> Optional[Item]:
+		return None
+
+	@app.get()
+	def without_model():
+		return None
+
+	assert call(with_model).get_data() == b""
+	assert call(without_model).get_data() == b""
+
+
+def test_response_model_filters_the_returned_value(app, call):
+	@app.get(response_model=Item)
+	def get_item():
+		return {"name": "pen", "secret": "hidden"}
+
+	response = call(get_item)
+
+	assert response.status_code == 200
+	assert response.headers["Content-Type"] == "application/json"
+	assert json.loads(response.get_data()) == {"name": "pen"}